@@ -1,13 +1,21 @@
 import os
+import math
 import logging
 from flask import Flask, render_template, request, redirect, url_for, flash, session
 from werkzeug.utils import secure_filename
 import pandas as pd
 import tempfile
 import uuid
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-from resume_parser import parse_resume, extract_information
-from recommendation_system import match_candidates, rank_candidates
+import hashlib
+import diskcache
+
+from resume_parser import parse_resume, extract_information, load_nlp, PARSER_VERSION
+from recommendation_system import (match_candidates, rank_candidates, empty_candidate_frame,
+                                   candidate_row, append_candidates)
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -22,19 +30,87 @@ ALLOWED_EXTENSIONS = {'pdf'}
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+UPLOAD_CHUNK_SIZE = 64 * 1024  # Uploads are copied to disk this many bytes at a time
+
+# In-memory columnar storage for parsed resumes. Requests run on threads and every write
+# rebinds the frame, so writers hold resumes_lock; readers take one reference and use only that.
+resumes_frame = empty_candidate_frame()
+resumes_lock = threading.Lock()
+
+# Parsed resumes keyed by parser version and a hash of the file contents, so re-uploads skip
+# parsing. The cache holds resume text, so it lives in the app's private instance folder and
+# entries expire.
+PARSE_CACHE_DIR = os.path.join(app.instance_path, 'resume_parse_cache')
+PARSE_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+os.makedirs(PARSE_CACHE_DIR, mode=0o700, exist_ok=True)
+parse_cache = diskcache.Cache(PARSE_CACHE_DIR)
 
-# In-memory storage for parsed resumes
-resumes_data = {}
+# Worker processes for PDF parsing, created on first upload and reused
+PARSE_WORKERS = min(os.cpu_count() or 1, 6)
+parse_pool = None
+
+# Upper bound on spaCy worker processes for NER over a batch of resumes
+NLP_WORKERS = os.cpu_count() or 1
+NLP_BATCH_SIZE = 16
+
+def nlp_processes(text_count):
+    """Start one spaCy process per batch, so uploads of a single batch stay in-process"""
+    return max(1, min(NLP_WORKERS, math.ceil(text_count / NLP_BATCH_SIZE)))
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def save_upload(file, file_path):
+    # Stream the upload to disk in fixed-size chunks, hashing it on the way
+    hasher = hashlib.blake2b()
+    with open(file_path, 'wb') as fh:
+        for chunk in iter(lambda: file.stream.read(UPLOAD_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+            fh.write(chunk)
+    return hasher.hexdigest()
+
+def get_parse_pool():
+    global parse_pool
+    if parse_pool is None:
+        parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+    return parse_pool
+
+def reset_parse_pool():
+    global parse_pool
+    if parse_pool is not None:
+        parse_pool.shutdown(wait=False, cancel_futures=True)
+        parse_pool = None
+
+def parse_files(paths):
+    try:
+        return list(get_parse_pool().map(_parse_file, paths))
+    except BrokenProcessPool as e:
+        # A worker died (e.g. MuPDF crashed or Tesseract was OOM-killed on a bad upload).
+        # Fail only this batch and start a fresh pool for the next upload.
+        logger.error(f"PDF parsing worker died, failing {len(paths)} file(s): {str(e)}")
+        reset_parse_pool()
+        return [(os.path.basename(file_path), None) for file_path in paths]
+
+def _parse_file(file_path):
+    # Runs in a worker process; errors are logged here so one bad file does not abort the batch
+    filename = os.path.basename(file_path)
+    try:
+        resume_text = parse_resume(file_path)
+        if not resume_text:
+            logger.warning(f"Could not extract text from {filename}")
+        return filename, resume_text
+    except Exception as e:
+        logger.error(f"Error processing file {filename}: {str(e)}")
+        return filename, None
+
 @app.route('/')
 def index():
     return render_template('index.html')
 
 @app.route('/upload', methods=['POST'])
 def upload_file():
+    global resumes_frame
+    
     if 'files[]' not in request.files:
         flash('No file part', 'danger')
         return redirect(request.url)
@@ -47,11 +123,17 @@ def upload_file():
     
     # Clear previous data if starting a new batch
     if request.form.get('clear_previous') == 'true':
-        resumes_data.clear()
+        with resumes_lock:
+            resumes_frame = empty_candidate_frame()
     
     parsed_count = 0
     failed_count = 0
+    cached_count = 0
+    temp_paths = []
+    saved_files = []
+    new_rows = []
     
+    # Save every upload first so the files can be parsed in parallel
     for file in files:
         if file and allowed_file(file.filename):
             filename = secure_filename(file.filename)
@@ -59,36 +141,66 @@ def upload_file():
             file_path = os.path.join(app.config['UPLOAD_FOLDER'], f"{resume_id}_{filename}")
             
             try:
-                file.save(file_path)
+                temp_paths.append(file_path)
+                digest = save_upload(file, file_path)
                 logger.debug(f"Saved file to {file_path}")
                 
-                # Parse the resume
-                resume_text = parse_resume(file_path)
-                if not resume_text:
-                    logger.warning(f"Could not extract text from {filename}")
-                    failed_count += 1
-                    continue
-                
-                # Extract information
-                resume_info = extract_information(resume_text)
-                if resume_info:
-                    resumes_data[resume_id] = {
-                        'filename': filename,
-                        'info': resume_info
-                    }
+                cached_info = parse_cache.get((PARSER_VERSION, digest))
+                if cached_info is not None:
+                    logger.debug(f"Using cached parse for {filename}")
+                    new_rows.append(candidate_row(resume_id, filename, cached_info))
                     parsed_count += 1
-                else:
-                    failed_count += 1
+                    cached_count += 1
+                    continue
                 
+                saved_files.append((resume_id, filename, file_path, digest))
             except Exception as e:
-                logger.error(f"Error processing file {filename}: {str(e)}")
+                logger.error(f"Error saving file {filename}: {str(e)}")
                 failed_count += 1
-            finally:
-                # Clean up the file
+    
+    try:
+        if saved_files:
+            # Parse the resumes in worker processes
+            paths = [file_path for _, _, file_path, _ in saved_files]
+            results = parse_files(paths)
+            
+            parsed = [(resume_id, filename, digest, resume_text)
+                      for (resume_id, filename, _, digest), (_, resume_text) in zip(saved_files, results)
+                      if resume_text]
+            
+            # Run spaCy over all texts as one batch across cores. Each text carries its index, so
+            # documents dropped by the error handler only affect their own resume. Texts over
+            # nlp.max_length would make pipe raise for the whole batch, so they are left out.
+            nlp = load_nlp()
+            batch = [(resume_text, index) for index, (_, _, _, resume_text) in enumerate(parsed)
+                     if len(resume_text) <= nlp.max_length]
+            docs = dict((index, doc) for doc, index in nlp.pipe(
+                batch, as_tuples=True, batch_size=NLP_BATCH_SIZE, n_process=nlp_processes(len(batch))))
+            
+            # Extract information; a resume without a doc is parsed again on its own
+            for index, (resume_id, filename, digest, resume_text) in enumerate(parsed):
                 try:
-                    os.remove(file_path)
+                    resume_info = extract_information(resume_text, doc=docs.get(index))
+                    if resume_info:
+                        parse_cache.set((PARSER_VERSION, digest), resume_info, expire=PARSE_CACHE_TTL)
+                        new_rows.append(candidate_row(resume_id, filename, resume_info))
+                        parsed_count += 1
                 except Exception as e:
-                    logger.error(f"Error removing temporary file {file_path}: {str(e)}")
+                    logger.error(f"Error processing file {filename}: {str(e)}")
+    except Exception as e:
+        logger.error(f"Error processing uploaded files: {str(e)}")
+    finally:
+        # Clean up the files
+        for file_path in temp_paths:
+            try:
+                os.remove(file_path)
+            except Exception as e:
+                logger.error(f"Error removing temporary file {file_path}: {str(e)}")
+    
+    failed_count += len(saved_files) + cached_count - parsed_count
+    with resumes_lock:
+        resumes_frame = append_candidates(resumes_frame, new_rows)
+        has_resumes = not resumes_frame.empty
     
     if parsed_count > 0:
         flash(f'Successfully parsed {parsed_count} resume(s)', 'success')
@@ -96,13 +208,14 @@ def upload_file():
         flash(f'Failed to parse {failed_count} resume(s)', 'warning')
     
     # Store resume data in session for persistence
-    session['has_resumes'] = len(resumes_data) > 0
+    session['has_resumes'] = has_resumes
     
     return redirect(url_for('index'))
 
 @app.route('/search', methods=['POST'])
 def search():
-    if not resumes_data:
+    candidates_frame = resumes_frame
+    if candidates_frame.empty:
         flash('No resumes have been uploaded yet', 'warning')
         return redirect(url_for('index'))
     
@@ -117,7 +230,7 @@ def search():
         min_experience = 0
     
     # Find matching candidates
-    matching_candidates = match_candidates(resumes_data, required_skills, min_experience)
+    matching_candidates = match_candidates(candidates_frame, required_skills, min_experience)
     
     # Rank candidates
     top_candidates = rank_candidates(matching_candidates, required_skills)
@@ -126,12 +239,15 @@ def search():
                           candidates=top_candidates, 
                           required_skills=required_skills,
                           min_experience=min_experience,
-                          total_candidates=len(resumes_data),
+                          total_candidates=len(candidates_frame),
                           matching_count=len(top_candidates))
 
 @app.route('/clear', methods=['POST'])
 def clear_data():
-    resumes_data.clear()
+    global resumes_frame
+    with resumes_lock:
+        resumes_frame = empty_candidate_frame()
+    parse_cache.clear()
     session['has_resumes'] = False
     flash('All resume data has been cleared', 'info')
     return redirect(url_for('index'))
@@ -1,73 +1,119 @@
 import logging
-from difflib import SequenceMatcher
+
+import numpy as np
+import pandas as pd
+from rapidfuzz import process, fuzz
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-def similarity_score(a, b):
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+def skill_hit_matrix(candidate_skills, required_skills, threshold=0.8):
+    # Lowercase once; every comparison below works on these copies.
+    candidates = np.array([skill.lower() for skill in candidate_skills])
+    required = np.array([skill.lower() for skill in required_skills])
+    
+    # N x M similarity matrix computed in C; scores below the cutoff come back as 0.
+    scores = process.cdist(candidates, required, scorer=fuzz.ratio, score_cutoff=threshold * 100)
+    
+    # Substring containment in either direction, broadcast over every (candidate, required) pair.
+    substring_hits = ((np.char.find(candidates[:, None], required[None, :]) >= 0) |
+                      (np.char.find(required[None, :], candidates[:, None]) >= 0))
+    
+    return (scores >= threshold * 100) | substring_hits
 
 def match_skills(candidate_skills, required_skills, threshold=0.8):
-    matched_skills = []
-    missing_skills = required_skills.copy()
+    # Each required skill counts once; dict keys keep the order they were given in
+    required_skills = list(dict.fromkeys(required_skills))
+    if not candidate_skills or not required_skills:
+        return [], required_skills
     
-    for candidate_skill in candidate_skills:
-        for req_skill in required_skills:
-            if (req_skill.lower() in candidate_skill.lower() or 
-                candidate_skill.lower() in req_skill.lower() or 
-                similarity_score(candidate_skill, req_skill) >= threshold):
-                if req_skill in missing_skills:
-                    missing_skills.remove(req_skill)
-                    matched_skills.append(req_skill)
-                break
+    matched_mask = skill_hit_matrix(candidate_skills, required_skills, threshold).any(axis=0)
+    matched = {skill for skill, hit in zip(required_skills, matched_mask) if hit}
+    matched_skills = [skill for skill in required_skills if skill in matched]
+    missing_skills = [skill for skill in required_skills if skill not in matched]
     
     return matched_skills, missing_skills
 
-def match_candidates(resumes_data, required_skills, min_experience):
-    matching_candidates = []
-    seen_keys = set()  # Using email if available, otherwise name
+# Columnar store of parsed resumes, one row per resume
+CANDIDATE_COLUMNS = ['resume_id', 'filename', 'name', 'email', 'total_experience_years', 'skills']
+
+def empty_candidate_frame():
+    return pd.DataFrame(columns=CANDIDATE_COLUMNS)
+
+def candidate_row(resume_id, filename, resume_info):
+    return {
+        'resume_id': resume_id,
+        'filename': filename,
+        'name': resume_info.name,
+        'email': resume_info.contact.get("email", ""),
+        'total_experience_years': float(resume_info.total_experience_years),
+        'skills': resume_info.skills
+    }
+
+def append_candidates(frame, rows):
+    if not rows:
+        return frame
+    new_rows = pd.DataFrame(rows, columns=CANDIDATE_COLUMNS)
+    return new_rows if frame.empty else pd.concat([frame, new_rows], ignore_index=True)
+
+def match_candidates(resumes_frame, required_skills, min_experience):
+    if resumes_frame.empty:
+        return []
+    
+    # Each required skill counts once towards the skill match score
+    required_skills = list(dict.fromkeys(required_skills))
+    
+    # Unique key based on email if present; else the candidate name.
+    email_key = resumes_frame['email'].str.lower().where(resumes_frame['email'] != '',
+                                                          resumes_frame['name'].str.lower())
+    candidates = resumes_frame[~email_key.duplicated()]
+    if len(candidates) < len(resumes_frame):
+        logger.debug(f"Skipping {len(resumes_frame) - len(candidates)} duplicate candidate(s)")
+    
+    # Skip if insufficient experience.
+    candidates = candidates[candidates['total_experience_years'] >= min_experience].reset_index(drop=True)
+    if candidates.empty:
+        return []
+    
+    # Match skills for every candidate at once: one score matrix over all skills, folded back per candidate.
+    required = np.array(required_skills, dtype=object)
+    if required_skills:
+        flat_skills = candidates['skills'].explode().dropna()
+        hits = np.zeros((len(candidates), len(required_skills)), dtype=bool)
+        if not flat_skills.empty:
+            flat_hits = skill_hit_matrix(flat_skills.tolist(), required_skills)
+            hits = (pd.DataFrame(flat_hits, index=flat_skills.index)
+                    .groupby(level=0).any()
+                    .reindex(candidates.index, fill_value=False)
+                    .to_numpy())
+        matched_counts = hits.sum(axis=1)
+        skill_match_score = matched_counts / len(required_skills)
+    else:
+        hits = np.zeros((len(candidates), 0), dtype=bool)
+        matched_counts = np.zeros(len(candidates), dtype=int)
+        skill_match_score = np.ones(len(candidates))
+    
+    candidates['matched_skills'] = [required[row].tolist() for row in hits]
+    candidates['missing_skills'] = [required[~row].tolist() for row in hits]
+    
+    # Bonus for experience beyond minimum.
+    experience_score = np.where(min_experience > 0,
+                                np.minimum(1.0, (candidates['total_experience_years'] - min_experience) / 5.0),
+                                0.5)
+    
+    # Overall match score (weighted average).
+    candidates['match_score'] = (skill_match_score * 0.7) + (experience_score * 0.3)
     
-    for resume_id, resume_data in resumes_data.items():
-        resume_info = resume_data['info']
-        # Create a unique key based on email if present; else use candidate name.
-        candidate_key = resume_info.contact.get("email", "").lower() or resume_info.name.lower()
-        if candidate_key in seen_keys:
-            logger.debug(f"Skipping duplicate candidate: {resume_info.name} ({candidate_key})")
-            continue
-        seen_keys.add(candidate_key)
-        
-        # Skip if insufficient experience.
-        if resume_info.total_experience_years < min_experience:
-            logger.debug(f"Candidate {resume_info.name} has insufficient experience: {resume_info.total_experience_years} < {min_experience}")
-            continue
-        
-        # Match skills.
-        matched_skills, missing_skills = match_skills(resume_info.skills, required_skills)
-        skill_match_score = len(matched_skills) / len(required_skills) if required_skills else 1.0
-        
-        if len(matched_skills) == 0 and required_skills:
-            logger.debug(f"Candidate {resume_info.name} has no matching skills")
-            continue
-        
-        # Bonus for experience beyond minimum.
-        experience_score = min(1.0, (resume_info.total_experience_years - min_experience) / 5.0) if min_experience > 0 else 0.5
-        
-        # Overall match score (weighted average).
-        match_score = (skill_match_score * 0.7) + (experience_score * 0.3)
-        
-        candidate_match = {
-            'resume_id': resume_id,
-            'name': resume_info.name,
-            'skills': resume_info.skills,
-            'total_experience': resume_info.total_experience_years,
-            'matched_skills': matched_skills,
-            'missing_skills': missing_skills,
-            'match_score': match_score
-        }
-        matching_candidates.append(candidate_match)
+    if required_skills:
+        no_match = matched_counts == 0
+        if no_match.any():
+            logger.debug(f"{int(no_match.sum())} candidate(s) have no matching skills")
+        candidates = candidates[~no_match]
     
-    return matching_candidates
+    candidates = candidates.rename(columns={'total_experience_years': 'total_experience'})
+    return candidates[['resume_id', 'name', 'skills', 'total_experience',
+                       'matched_skills', 'missing_skills', 'match_score']].to_dict(orient='records')
 
 def rank_candidates(candidates, required_skills):
     sorted_candidates = sorted(candidates, key=lambda x: x['match_score'], reverse=True)
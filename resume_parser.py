@@ -2,7 +2,6 @@ import logging
 import re
 import sys
 import os
-import io
 from datetime import datetime
 
 # Configure logging
@@ -10,45 +9,72 @@ logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 # Import libraries for PDF processing, OCR, and NLP
-import pdfplumber
 import spacy
 from dateutil import parser as date_parser
-from dateutil.relativedelta import relativedelta
+import numpy as np
 import pytesseract
 from PIL import Image
+from fitz_wrapper import fitz
 
-# Initialize spaCy NLP model
 try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    logger.warning("Spacy model not found. Downloading...")
-    import subprocess
-    subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-    nlp = spacy.load("en_core_web_sm")
+    import ahocorasick
+except ImportError:
+    logger.debug("pyahocorasick not installed, matching skills with a single regex")
+    ahocorasick = None
+
+# Bump when extraction output changes, so cached parses from older versions are ignored
+PARSER_VERSION = 1
+
+# spaCy NLP model, loaded once per process by load_nlp()
+nlp = None
+
+# Only the named entities are used, so skip the rest of the pipeline
+NLP_DISABLED_COMPONENTS = ["parser", "tagger", "lemmatizer", "attribute_ruler"]
+
+def log_nlp_error(proc_name, proc, docs, e):
+    # Skip the documents a component failed on instead of aborting the whole nlp.pipe run.
+    # The multiprocess pipe reports worker errors without the component or its docs.
+    failed = f"{len(docs)} document(s)" if docs is not None else "a batch"
+    logger.error(f"spaCy component {proc_name} failed on {failed}: {str(e)}")
+
+def load_nlp():
+    global nlp
+    if nlp is None:
+        try:
+            nlp = spacy.load("en_core_web_sm", disable=NLP_DISABLED_COMPONENTS)
+        except OSError:
+            logger.warning("Spacy model not found. Downloading...")
+            import subprocess
+            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
+            nlp = spacy.load("en_core_web_sm", disable=NLP_DISABLED_COMPONENTS)
+        nlp.set_error_handler(log_nlp_error)
+    return nlp
 
 from models import ResumeInfo, Education, Experience
 
+# A document with at least this much embedded text is not a scan, so its empty pages are not OCR'd
+OCR_TEXT_THRESHOLD = 500
+
 def parse_resume(pdf_path):
     try:
         logger.debug(f"Opening PDF: {pdf_path}")
-        text = ""
         
-        # Try to extract text with pdfplumber
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text() or ""
-                
-                # If no text is found, try OCR
-                if not page_text.strip():
-                    logger.debug(f"No text found in page {page.page_number}, trying OCR")
-                    # Convert page to image
-                    img = page.to_image(resolution=300)
-                    img_bytes = img.original.tobytes()
-                    pil_img = Image.open(io.BytesIO(img_bytes))
-                    # Run OCR
-                    page_text = pytesseract.image_to_string(pil_img)
-                
-                text += page_text + "\n"
+        # Extract the text layer with PyMuPDF
+        with fitz.open(pdf_path) as pdf:
+            page_texts = [page.get_text("text") for page in pdf]
+            
+            # If the document has little or no text, try OCR on the empty pages
+            if sum(len(page_text.strip()) for page_text in page_texts) < OCR_TEXT_THRESHOLD:
+                for page in pdf:
+                    if not page_texts[page.number].strip():
+                        logger.debug(f"No text found in page {page.number + 1}, trying OCR")
+                        # Render the page straight into a grayscale image; Tesseract works on gray anyway
+                        pix = page.get_pixmap(dpi=300, colorspace=fitz.csGRAY)
+                        pil_img = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+                        # Run OCR
+                        page_texts[page.number] = pytesseract.image_to_string(pil_img)
+        
+        text = "".join(page_text + "\n" for page_text in page_texts)
         
         if not text.strip():
             logger.warning(f"Failed to extract any text from {pdf_path}")
@@ -60,7 +86,7 @@ def parse_resume(pdf_path):
         logger.error(f"Error parsing PDF {pdf_path}: {str(e)}")
         return None
 
-def extract_information(text):
+def extract_information(text, doc=None):
     if not text:
         return None
     
@@ -68,8 +94,9 @@ def extract_information(text):
         info = ResumeInfo()
         info.raw_text = text
         
-        # Parse with spaCy
-        doc = nlp(text)
+        # Parse with spaCy unless the caller already did
+        if doc is None:
+            doc = load_nlp()(text)
         
         # Extract name (assuming the name is at the beginning of the resume)
         info.name = extract_name(doc, text)
@@ -77,14 +104,17 @@ def extract_information(text):
         # Extract contact information
         info.contact = extract_contact_info(text)
         
+        # Split out the skills, education and experience sections once for all extractors
+        sections = split_sections(text)
+        
         # Extract skills
-        info.skills = extract_skills(text)
+        info.skills = extract_skills(text, sections)
         
         # Extract education
-        info.education = extract_education(text, doc)
+        info.education = extract_education(text, doc, sections)
         
         # Extract experience and calculate total experience
-        info.experience = extract_experience(text, doc)
+        info.experience = extract_experience(text, doc, sections)
         info.total_experience_years = calculate_total_experience(info.experience)
         
         return info
@@ -93,12 +123,14 @@ def extract_information(text):
         logger.error(f"Error extracting information: {str(e)}")
         return None
 
+DIGIT_RE = re.compile(r'\d')
+
 def extract_name(doc, text):
     # First, try to use a heuristic based on the first few lines
     lines = text.splitlines()
     for line in lines[:5]:
         # Ignore lines that contain an email, phone number, or are too long
-        if "@" in line or re.search(r'\d', line):
+        if "@" in line or DIGIT_RE.search(line):
             continue
         # Assume a candidate name is usually one or two words and in title case
         words = line.strip().split()
@@ -127,6 +159,26 @@ def extract_name(doc, text):
     
     return "Unknown Name"
 
+# Contact details
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_RE = re.compile(r'(?:\+\d{1,2}\s?)?(?:\(\d{3}\)|\d{3})[-.\s]?\d{3}[-.\s]?\d{4}')
+LINKEDIN_RE = re.compile(r'(?:linkedin\.com/in/|linkedin\.com/profile/view\?id=|linkedin\.com/pub/)[a-zA-Z0-9_-]+')
+
+# Every contact pattern in one alternation, so the text is scanned once for all of them.
+# Emails come first so digits inside an address are not taken for a phone number.
+CONTACT_RE = re.compile(
+    r'(?P<email>' + EMAIL_RE.pattern + r')'
+    r'|(?P<linkedin>(?i:' + LINKEDIN_RE.pattern + r'))'
+    r'|(?P<phone>' + PHONE_RE.pattern + r')'
+)
+
+def scan_all(text):
+    """Collect email, phone and LinkedIn matches from a single pass over text"""
+    matches = {"email": [], "phone": [], "linkedin": []}
+    for match in CONTACT_RE.finditer(text):
+        matches[match.lastgroup].append(match.group())
+    return matches
+
 def extract_contact_info(text):
     contact = {
         "email": "",
@@ -135,75 +187,97 @@ def extract_contact_info(text):
         "address": ""
     }
     
+    matches = scan_all(text)
+    
     # Extract email
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_matches = re.findall(email_pattern, text)
-    if email_matches:
-        contact["email"] = email_matches[0]
+    if matches["email"]:
+        contact["email"] = matches["email"][0]
     
     # Extract phone number
-    phone_pattern = r'(?:\+\d{1,2}\s?)?(?:\(\d{3}\)|\d{3})[-.\s]?\d{3}[-.\s]?\d{4}'
-    phone_matches = re.findall(phone_pattern, text)
-    if phone_matches:
-        contact["phone"] = phone_matches[0]
+    if matches["phone"]:
+        contact["phone"] = matches["phone"][0]
     
     # Extract LinkedIn
-    linkedin_pattern = r'(?:linkedin\.com/in/|linkedin\.com/profile/view\?id=|linkedin\.com/pub/)[a-zA-Z0-9_-]+'
-    linkedin_matches = re.findall(linkedin_pattern, text.lower())
-    if linkedin_matches:
-        contact["linkedin"] = linkedin_matches[0]
+    if matches["linkedin"]:
+        contact["linkedin"] = matches["linkedin"][0].lower()
     
     return contact
 
-def extract_skills(text):
-    # Common skill keywords to look for
-    common_skills = [
-        # Programming languages
-        "python", "java", "javascript", "c++", "c#", "ruby", "php", "swift", "kotlin", "go", "rust",
-        # Web development
-        "html", "css", "react", "angular", "vue", "node.js", "express", "django", "flask", "spring",
-        # Data science
-        "machine learning", "deep learning", "data analysis", "natural language processing", "computer vision",
-        "pandas", "numpy", "scipy", "scikit-learn", "tensorflow", "pytorch", "keras",
-        # Databases
-        "sql", "mysql", "postgresql", "mongodb", "oracle", "redis", "elasticsearch",
-        # Cloud
-        "aws", "azure", "google cloud", "docker", "kubernetes", "terraform",
-        # Other tech skills
-        "agile", "scrum", "git", "ci/cd", "rest api", "graphql", "microservices", "devops",
-        # Soft skills
-        "leadership", "communication", "teamwork", "problem solving", "time management", "project management",
-        "critical thinking", "creativity", "attention to detail", "organization"
-    ]
-    
-    # Additional keywords that might indicate skills but need validation
-    potential_skill_words = [
-        "bootstrap", "jquery", "sass", "typescript", "api", "mvc", "oop", "tableau", "power bi",
-        "excel", "word", "powerpoint", "photoshop", "illustrator", "analytics", "presentation",
-        "troubleshooting", "debugging", "testing", "qa", "ux", "ui", "design"
-    ]
-    
-    skills = []
+# Common skill keywords to look for
+COMMON_SKILLS = (
+    # Programming languages
+    "python", "java", "javascript", "c++", "c#", "ruby", "php", "swift", "kotlin", "go", "rust",
+    # Web development
+    "html", "css", "react", "angular", "vue", "node.js", "express", "django", "flask", "spring",
+    # Data science
+    "machine learning", "deep learning", "data analysis", "natural language processing", "computer vision",
+    "pandas", "numpy", "scipy", "scikit-learn", "tensorflow", "pytorch", "keras",
+    # Databases
+    "sql", "mysql", "postgresql", "mongodb", "oracle", "redis", "elasticsearch",
+    # Cloud
+    "aws", "azure", "google cloud", "docker", "kubernetes", "terraform",
+    # Other tech skills
+    "agile", "scrum", "git", "ci/cd", "rest api", "graphql", "microservices", "devops",
+    # Soft skills
+    "leadership", "communication", "teamwork", "problem solving", "time management", "project management",
+    "critical thinking", "creativity", "attention to detail", "organization"
+)
+
+# Additional keywords that might indicate skills but need validation
+POTENTIAL_SKILL_WORDS = (
+    "bootstrap", "jquery", "sass", "typescript", "api", "mvc", "oop", "tableau", "power bi",
+    "excel", "word", "powerpoint", "photoshop", "illustrator", "analytics", "presentation",
+    "troubleshooting", "debugging", "testing", "qa", "ux", "ui", "design"
+)
+
+ALL_SKILLS = COMMON_SKILLS + POTENTIAL_SKILL_WORDS
+
+# One automaton over every skill keyword, so a resume is scanned once for all of them
+if ahocorasick is not None:
+    SKILL_AUTOMATON = ahocorasick.Automaton()
+    for skill in ALL_SKILLS:
+        SKILL_AUTOMATON.add_word(skill, skill)
+    SKILL_AUTOMATON.make_automaton()
+else:
+    SKILL_AUTOMATON = None
+
+# Fallback: every skill fused into one alternation. The lookahead keeps matches
+# zero-width so overlapping skills ("rest api" and "api") are all found.
+_SKILL_RE = re.compile(
+    r'(?=\b(' + '|'.join(map(re.escape, sorted(ALL_SKILLS, key=len, reverse=True))) + r')\b)',
+    re.IGNORECASE
+)
+
+def is_word_char(char):
+    return char.isalnum() or char == "_"
+
+def has_word_boundaries(text, start, end):
+    # Same test as regex \b on both ends of text[start:end + 1]
+    before = is_word_char(text[start - 1]) if start > 0 else False
+    after = is_word_char(text[end + 1]) if end + 1 < len(text) else False
+    return (before != is_word_char(text[start])) and (after != is_word_char(text[end]))
+
+# Separators between the items listed in a skills section
+SKILL_ITEM_SPLIT_RE = re.compile(r'[,•\n]')
+
+def extract_skills(text, sections=None):
     text_lower = text.lower()
     
-    # Use regex word-boundary to ensure an exact match.
-    for skill in common_skills:
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            skills.append(skill)
-    
-    for skill in potential_skill_words:
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            skills.append(skill)
+    # Single pass over the text; enforce word boundaries for an exact match.
+    if SKILL_AUTOMATON is not None:
+        skills = list({skill for end, skill in SKILL_AUTOMATON.iter(text_lower)
+                       if has_word_boundaries(text_lower, end - len(skill) + 1, end)})
+    else:
+        skills = list({skill.lower() for skill in _SKILL_RE.findall(text)})
     
     # Look for skills sections with higher confidence
-    skills_section_pattern = r'(?:skills|technical skills|technologies|competencies|expertise)(?::|\.|\n)([\s\S]*?)(?:\n\n|\n\w+:|\Z)'
-    skills_section_matches = re.findall(skills_section_pattern, text_lower, re.IGNORECASE)
+    if sections is None:
+        sections = split_sections(text)
+    skills_section_matches = [text[start:end].lower() for start, end in skills_section_spans(text, sections)]
     
     if skills_section_matches:
         for section in skills_section_matches:
-            for item in re.split(r'[,•\n]', section):
+            for item in SKILL_ITEM_SPLIT_RE.split(section):
                 item = item.strip()
                 if is_valid_skill(item) and item not in skills:
                     skills.append(item)
@@ -212,6 +286,15 @@ def extract_skills(text):
 
 
 
+# Stop phrases that suggest an item is not a skill, matched in one scan
+STOP_PHRASES = (
+    "responsible for", "worked with", "managed", "collaborated", "helped", "assisted",
+    "developed", "created", "designed", "implemented", "maintained", "contributed",
+    "participated in", "involved in", "experience in", "experience with", "knowledge of",
+    "proficient in", "familiar with", "expertise in"
+)
+STOP_RE = re.compile('|'.join(map(re.escape, STOP_PHRASES)))
+
 def is_valid_skill(text):
     if not text or len(text) < 2:
         return False
@@ -221,63 +304,101 @@ def is_valid_skill(text):
         return False
     
     # Ignore strings with certain stop phrases that suggest they're not skills
-    stop_phrases = [
-        "responsible for", "worked with", "managed", "collaborated", "helped", "assisted",
-        "developed", "created", "designed", "implemented", "maintained", "contributed",
-        "participated in", "involved in", "experience in", "experience with", "knowledge of",
-        "proficient in", "familiar with", "expertise in"
-    ]
-    
-    for phrase in stop_phrases:
-        if phrase in text.lower():
-            return False
-    
-    # Ignore if contains too many words (likely a phrase, not a skill)
-    words = text.split()
-    if len(words) > 4:
+    if STOP_RE.search(text.lower()):
+        return False
+    
+    # Ignore if contains too many words (likely a phrase, not a skill); at most 5 pieces are split off
+    if len(text.split(None, 4)) > 4:
         return False
     
     return True
 
-def extract_education(text, doc):
+# Common education, work experience and skills section headers, in lookup priority order
+EDU_HEADERS = ("education", "academic background", "academic qualification")
+EXP_HEADERS = ("experience", "work experience", "professional experience", "employment history", "work history")
+SKILLS_HEADERS = ("skills", "technical skills", "technologies", "competencies", "expertise")
+
+# Every section header in one pattern. The match is zero-width so headers can overlap and
+# none is hidden inside another section's body; each body is found separately by SECTION_END_RE.
+SECTION_HEADER_RE = re.compile(
+    r'(?=(?P<hdr>' + '|'.join(map(re.escape, sorted(EDU_HEADERS + EXP_HEADERS + SKILLS_HEADERS, key=len, reverse=True))) + r')'
+    r'(?P<sep>:|\.|\n))',
+    re.IGNORECASE
+)
+# A section body runs to a blank line, the next "header:" line or the end
+SECTION_END_RE = re.compile(r'\n\n|\n\w+:|\Z')
+
+# Degree names
+DEGREE_RES = (
+    re.compile(r'(?:Bachelor|BS|BA|B\.S\.|B\.A\.|Master|MS|MA|M\.S\.|M\.A\.|PhD|Ph\.D\.|MD|M\.D\.|MBA|M\.B\.A\.)[^\n,]*', re.IGNORECASE),
+    re.compile(r'(?:Bachelor\'s|Master\'s|Doctorate|Doctoral|Associate\'s|Associate)[^\n,]*', re.IGNORECASE)
+)
+
+# Dates and date ranges such as "Jan 2018 - March 2020", "2019 - present" or "2016"
+MONTH_PATTERN = r'(?:Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|September|Oct|October|Nov|November|Dec|December)'
+EDU_DATE_RE = re.compile(rf'''
+    \b{MONTH_PATTERN}?\s*\d{{4}}\s*(?:-|–|to)?\s*{MONTH_PATTERN}?\s*\d{{0,4}}\b
+  | \b\d{{4}}\s*(?:-|–|to)?\s*(?:present|current|now)\b
+  | \b\d{{4}}\b
+''', re.IGNORECASE | re.VERBOSE)
+EXP_DATE_RE = re.compile(rf'''
+    \b{MONTH_PATTERN}?\s*\d{{4}}\s*(?:-|–|to)?\s*{MONTH_PATTERN}?\s*\d{{0,4}}\b
+  | \b\d{{4}}\s*(?:-|–|to)?\s*(?:present|current|now)\b
+  | \b\d{{4}}\s*(?:-|–|to)?\s*\d{{4}}\b
+''', re.IGNORECASE | re.VERBOSE)
+DATE_RANGE_SPLIT_RE = re.compile(r'-|–|to')
+
+# Job entries start on a line beginning with a year, a "word year" pair or a month name
+JOB_SPLIT_RE = re.compile(rf'\n(?=\d{{4}}|\w{{3,}}\s+\d{{4}}|[A-Z][a-z]+\s+\d{{4}}|\b{MONTH_PATTERN}\b)')
+JOB_TITLE_RE = re.compile(r'^([A-Za-z\s,]+)(?:at|,|\n)')
+COMPANY_RE = re.compile(r'(?:at|@)\s+([A-Za-z0-9\s&.,]+)')
+
+def skills_section_spans(text, sections):
+    """Yield skills bodies in text order as one non-overlapping scan reads them.
+
+    A skills header inside an earlier skills body or its terminator is skipped, so "Technical
+    Skills:" is read once and a "Word:" line that ends a skills body never starts another.
+    """
+    # Every header is followed by a one-character separator
+    spans = sorted((start - len(header) - 1, start, end) for header in SKILLS_HEADERS for start, end in sections.get(header, ()))
+    scan_pos = 0
+    for header_start, start, end in spans:
+        if header_start >= scan_pos:
+            scan_pos = SECTION_END_RE.match(text, end).end()
+            yield start, end
+
+def split_sections(text):
+    """Map each section header to the (start, end) offsets of every body following it in text"""
+    sections = {}
+    for match in SECTION_HEADER_RE.finditer(text):
+        body_start = match.end('sep')
+        body_end = SECTION_END_RE.search(text, body_start).start()
+        sections.setdefault(match.group('hdr').lower(), []).append((body_start, body_end))
+    return sections
+
+def extract_education(text, doc, sections=None):
     education_list = []
     
-    # Common education section headers
-    edu_headers = ["education", "academic background", "academic qualification"]
-    
     # Find education section
-    text_lower = text.lower()
-    education_section = None
-    
-    for header in edu_headers:
-        if header in text_lower:
-            pattern = rf'{header}(?::|\.|\n)([\s\S]*?)(?:\n\n|\n\w+:|\Z)'
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                education_section = matches[0]
-                break
+    if sections is None:
+        sections = split_sections(text)
+    edu_start, edu_end = next((sections[header][0] for header in EDU_HEADERS if header in sections), (0, 0))
+    education_section = text[edu_start:edu_end].lower()
     
     if not education_section:
         return education_list
     
     # Extract degree information using patterns
-    degree_patterns = [
-        r'(?:Bachelor|BS|BA|B\.S\.|B\.A\.|Master|MS|MA|M\.S\.|M\.A\.|PhD|Ph\.D\.|MD|M\.D\.|MBA|M\.B\.A\.)[^\n,]*',
-        r'(?:Bachelor\'s|Master\'s|Doctorate|Doctoral|Associate\'s|Associate)[^\n,]*'
-    ]
-    
     potential_degrees = []
-    for pattern in degree_patterns:
-        matches = re.findall(pattern, education_section, re.IGNORECASE)
-        potential_degrees.extend(matches)
+    for degree_re in DEGREE_RES:
+        potential_degrees.extend(degree_re.findall(education_section))
     
     # Extract dates from education section
-    date_pattern = r'\b(?:Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|September|Oct|October|Nov|November|Dec|December)?\s*\d{4}\s*(?:-|–|to)?\s*(?:Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|September|Oct|October|Nov|November|Dec|December)?\s*\d{0,4}\b|\b\d{4}\s*(?:-|–|to)?\s*(?:present|current|now)\b|\b\d{4}\b'
-    dates = re.findall(date_pattern, education_section, re.IGNORECASE)
+    dates = EDU_DATE_RE.findall(education_section)
     
-    # Extract institutions using spaCy's named entity recognition
-    edu_doc = nlp(education_section)
-    institutions = [ent.text for ent in edu_doc.ents if ent.label_ in ["ORG", "GPE"]]
+    # Extract institutions from the entities spaCy already found in this section
+    edu_span = doc.char_span(edu_start, edu_end, alignment_mode="expand")
+    institutions = [ent.text for ent in edu_span.ents if ent.label_ in ("ORG", "GPE")] if edu_span is not None else []
     
     # Create education entries
     for i, degree in enumerate(potential_degrees):
@@ -295,7 +416,7 @@ def extract_education(text, doc):
             date_text = dates[i]
             try:
                 if "-" in date_text or "–" in date_text or "to" in date_text:
-                    date_parts = re.split(r'-|–|to', date_text)
+                    date_parts = DATE_RANGE_SPLIT_RE.split(date_text)
                     edu.start_date = date_parser.parse(date_parts[0].strip(), fuzzy=True)
                     
                     if len(date_parts) > 1 and date_parts[1].strip():
@@ -313,59 +434,57 @@ def extract_education(text, doc):
     
     return education_list
 
-def extract_experience(text, doc):
+def extract_experience(text, doc, sections=None):
     """Extract work experience information"""
     experience_list = []
-    
-    # Common work experience section headers
-    exp_headers = ["experience", "work experience", "professional experience", "employment history", "work history"]
+    dated_experience = []
     
     # Find experience section
-    text_lower = text.lower()
-    experience_section = None
-    
-    for header in exp_headers:
-        if header in text_lower:
-            pattern = rf'{header}(?::|\.|\n)([\s\S]*?)(?:\n\n|\n\w+:|\Z)'
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                experience_section = matches[0]
-                break
+    if sections is None:
+        sections = split_sections(text)
+    exp_start, exp_end = next((sections[header][0] for header in EXP_HEADERS if header in sections), (0, 0))
+    experience_section = text[exp_start:exp_end].lower()
     
     if not experience_section:
         return experience_list
     
     # Split the experience section by job entries
     # Look for patterns like dates, company names, or job titles at the beginning of lines
-    job_entries = re.split(r'\n(?=\d{4}|\w{3,}\s+\d{4}|[A-Z][a-z]+\s+\d{4}|\b(?:Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|September|Oct|October|Nov|November|Dec|December)\b)', experience_section)
+    job_entries = JOB_SPLIT_RE.split(experience_section)
     
-    for entry in job_entries:
+    # Offsets of each entry in text; the split consumes exactly one newline between entries.
+    # They only line up with text if lowercasing kept the length (e.g. 'İ' lowercases to two characters).
+    offsets_aligned = len(experience_section) == exp_end - exp_start
+    entry_starts = [exp_start]
+    for entry in job_entries[:-1]:
+        entry_starts.append(entry_starts[-1] + len(entry) + 1)
+    
+    for entry, entry_start in zip(job_entries, entry_starts):
         if not entry.strip():
             continue
             
         exp = Experience()
         
         # Extract job title
-        title_pattern = r'^([A-Za-z\s,]+)(?:at|,|\n)'
-        title_match = re.search(title_pattern, entry)
+        title_match = JOB_TITLE_RE.search(entry)
         if title_match:
             exp.title = title_match.group(1).strip()
         
         # Extract company name
-        company_pattern = r'(?:at|@)\s+([A-Za-z0-9\s&.,]+)'
-        company_match = re.search(company_pattern, entry)
+        company_match = COMPANY_RE.search(entry)
         if company_match:
             exp.company = company_match.group(1).strip()
         else:
-            # Try finding organizations with spaCy
-            entry_doc = nlp(entry)
-            orgs = [ent.text for ent in entry_doc.ents if ent.label_ == "ORG"]
+            # Try finding organizations among the entities spaCy already found in this entry
+            entry_span = None
+            if offsets_aligned:
+                entry_span = doc.char_span(entry_start, entry_start + len(entry), alignment_mode="expand")
+            orgs = [ent.text for ent in entry_span.ents if ent.label_ == "ORG"] if entry_span is not None else []
             if orgs:
                 exp.company = orgs[0]
         
         # Extract dates and calculate duration
-        date_pattern = r'\b(?:Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|September|Oct|October|Nov|November|Dec|December)?\s*\d{4}\s*(?:-|–|to)?\s*(?:Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|September|Oct|October|Nov|November|Dec|December)?\s*\d{0,4}\b|\b\d{4}\s*(?:-|–|to)?\s*(?:present|current|now)\b|\b\d{4}\s*(?:-|–|to)?\s*\d{4}\b'
-        date_matches = re.findall(date_pattern, entry, re.IGNORECASE)
+        date_matches = EXP_DATE_RE.findall(entry)
         
         if date_matches:
             date_text = date_matches[0]
@@ -391,14 +510,8 @@ def extract_experience(text, doc):
                     # Just a single date, assume it's the start date
                     exp.start_date = date_parser.parse(date_text, fuzzy=True)
                 
-                # Calculate duration
-                if exp.start_date and exp.end_date:
-                    delta = relativedelta(exp.end_date, exp.start_date)
-                    exp.duration_years = delta.years + (delta.months / 12)
-                elif exp.start_date:
-                    # If only start date is available, assume it's recent experience
-                    delta = relativedelta(datetime.now(), exp.start_date)
-                    exp.duration_years = delta.years + (delta.months / 12)
+                # Duration is calculated for all entries at once below
+                dated_experience.append(exp)
                 
             except Exception as e:
                 logger.debug(f"Error parsing experience date: {str(e)}")
@@ -408,6 +521,16 @@ def extract_experience(text, doc):
         
         experience_list.append(exp)
     
+    # Calculate durations in whole months for every dated entry in one pass
+    if dated_experience:
+        starts = np.array([exp.start_date for exp in dated_experience], dtype='datetime64[M]')
+        ends = np.array([exp.end_date for exp in dated_experience], dtype='datetime64[M]')
+        # If only start date is available, assume it's recent experience
+        ends = np.where(np.isnat(ends), np.datetime64('today', 'M'), ends)
+        durations = (ends - starts).astype(int) / 12.0
+        for exp, duration in zip(dated_experience, durations):
+            exp.duration_years = float(duration)
+    
     return experience_list
 
 def calculate_total_experience(experience_list):
@@ -415,4 +538,4 @@ def calculate_total_experience(experience_list):
     if not experience_list:
         return 0.0
     
-    return sum(exp.duration_years for exp in experience_list)
+    return float(np.sum([exp.duration_years for exp in experience_list]))
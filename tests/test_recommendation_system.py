@@ -0,0 +1,63 @@
+import pytest
+
+from recommendation_system import empty_candidate_frame, append_candidates, match_candidates
+
+
+def candidate(name, email="", years=0.0, skills=()):
+    return {'resume_id': name, 'filename': f"{name}.pdf", 'name': name, 'email': email,
+            'total_experience_years': float(years), 'skills': list(skills)}
+
+
+def frame(*rows):
+    return append_candidates(empty_candidate_frame(), list(rows))
+
+
+def test_duplicate_email_or_name_keeps_first_row():
+    resumes = frame(
+        candidate("Jane Doe", "jane@x.com", 3, ["python"]),
+        candidate("Jane D.", "JANE@x.com", 9, ["python"]),
+        candidate("John Smith", "", 2, ["python"]),
+        candidate("john smith", "", 8, ["python"]),
+    )
+    matches = match_candidates(resumes, ["python"], 0)
+    assert [(match['name'], match['total_experience']) for match in matches] == [("Jane Doe", 3.0), ("John Smith", 2.0)]
+
+
+def test_min_experience_filters_candidates():
+    resumes = frame(candidate("Junior", years=1, skills=["sql"]), candidate("Senior", years=6, skills=["sql"]))
+    matches = match_candidates(resumes, ["sql"], 3)
+    assert [match['name'] for match in matches] == ["Senior"]
+    assert matches[0]['match_score'] == pytest.approx(0.7 + 0.3 * 0.6)
+
+
+def test_candidate_without_skills_is_dropped_when_skills_are_required():
+    resumes = frame(candidate("Empty", "e@x.com", 4, []), candidate("Dev", "d@x.com", 4, ["docker"]))
+    assert [match['name'] for match in match_candidates(resumes, ["docker"], 0)] == ["Dev"]
+
+
+def test_no_required_skills_scores_everyone_fully():
+    resumes = frame(candidate("Empty", "e@x.com", 1, []), candidate("Dev", "d@x.com", 2, ["docker"]))
+    matches = match_candidates(resumes, [], 0)
+    assert [match['name'] for match in matches] == ["Empty", "Dev"]
+    assert [match['match_score'] for match in matches] == pytest.approx([0.85, 0.85])
+    assert all(match['matched_skills'] == [] and match['missing_skills'] == [] for match in matches)
+
+
+def test_experience_score_is_half_without_minimum():
+    resumes = frame(candidate("Dev", "d@x.com", 12, ["python", "go"]))
+    [match] = match_candidates(resumes, ["python", "rust"], 0)
+    assert match['match_score'] == pytest.approx(0.5 * 0.7 + 0.5 * 0.3)
+
+
+def test_matched_and_missing_skills_follow_required_order():
+    resumes = frame(candidate("Dev", "d@x.com", 2, ["Kubernetes", "react", "Python"]))
+    [match] = match_candidates(resumes, ["python", "aws", "react", "python", "kubernetes", "java"], 0)
+    assert match['matched_skills'] == ["python", "react", "kubernetes"]
+    assert match['missing_skills'] == ["aws", "java"]
+
+
+def test_candidate_skill_can_match_several_requirements():
+    resumes = frame(candidate("Dev", "d@x.com", 2, ["mysql"]))
+    [match] = match_candidates(resumes, ["sql", "mysql"], 0)
+    assert match['matched_skills'] == ["sql", "mysql"]
+    assert match['missing_skills'] == []
@@ -0,0 +1,88 @@
+import re
+
+import spacy
+
+import resume_parser
+from resume_parser import (EDU_HEADERS, EXP_HEADERS, split_sections, skills_section_spans, extract_skills,
+                           extract_experience)
+
+# PyMuPDF text layers usually have no blank lines between sections
+NO_BLANK_LINE_TEXTS = [
+    "John Smith\nSkills\nPython, Docker\nExperience\nEngineer at Acme Corp\nJan 2015 - March 2020\n",
+    "Jane Doe\nEducation\nBachelor of Science, MIT 2014\nExperience\nDeveloper at Initech\n2016 - 2021\n",
+    "Jane Doe\nWork Experience\nAnalyst at Globex\n2012 - 2018\nEducation.\nMaster of Arts 2010\n3 years of experience.\n",
+    # Skills headers are common words and must not hide the sections after them
+    "Summary\nBuilt systems with modern technologies.\nWork Experience\nEngineer at Acme\n2015 - 2020\nEducation\nBS 2014\n",
+    "Ann Lee\nExpertise: cloud\nTechnical Skills.\nPython\nEducation\nBA 2011\nEmployment History\nLead at Hooli\n2012 - 2019\n",
+]
+
+# Skills sections that end in another header line, nest a header or share a span
+SKILLS_SECTION_TEXTS = NO_BLANK_LINE_TEXTS + [
+    "Jane Doe\nTechnical Skills: Python, SQL\nExpertise: Cloud\nExperience\nEngineer at Acme\n2015 - 2020\n",
+    "Skills: Git\n\nCompetencies.\nLeadership\nSkills: Excel\nExpertise\nDesign\n",
+]
+
+
+def baseline_section(text, headers):
+    # Section lookup as the original extractors did it: one search per header, first match wins
+    text_lower = text.lower()
+    for header in headers:
+        if header in text_lower:
+            matches = re.findall(rf'{header}(?::|\.|\n)([\s\S]*?)(?:\n\n|\n\w+:|\Z)', text_lower, re.IGNORECASE)
+            if matches:
+                return matches[0]
+    return None
+
+
+def baseline_skills_sections(text):
+    # Skills sections as the original extract_skills read them: one non-overlapping findall
+    return re.findall(r'(?:skills|technical skills|technologies|competencies|expertise)(?::|\.|\n)([\s\S]*?)(?:\n\n|\n\w+:|\Z)',
+                      text.lower(), re.IGNORECASE)
+
+
+def section(text, sections, headers):
+    spans = next((sections[header] for header in headers if header in sections), None)
+    return text[spans[0][0]:spans[0][1]].lower() if spans else None
+
+
+def test_split_sections_matches_baseline_without_blank_lines():
+    for text in NO_BLANK_LINE_TEXTS:
+        sections = split_sections(text)
+        assert section(text, sections, EDU_HEADERS) == baseline_section(text, EDU_HEADERS)
+        assert section(text, sections, EXP_HEADERS) == baseline_section(text, EXP_HEADERS)
+
+
+def test_experience_found_after_skills_section_without_blank_lines():
+    text = NO_BLANK_LINE_TEXTS[0]
+    experience = extract_experience(text, spacy.blank("en")(text))
+    total = resume_parser.calculate_total_experience(experience)
+    assert round(total, 2) == 5.17
+
+
+def test_skills_words_do_not_hide_education_or_experience():
+    text = NO_BLANK_LINE_TEXTS[3]
+    sections = split_sections(text)
+    assert section(text, sections, EDU_HEADERS) == "bs 2014\n"
+    assert section(text, sections, EXP_HEADERS) == "engineer at acme\n2015 - 2020\neducation\nbs 2014\n"
+    assert "technologies" in sections
+
+
+def test_experience_skips_entity_spans_when_lowercasing_changes_length():
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([{"label": "ORG", "pattern": "Initech"}, {"label": "ORG", "pattern": "Hooli"}])
+    # Each 'İ' lowercases to two characters, pushing later offsets one entry further along
+    text = "Experience:\n" + "İ" * 30 + ", Globex\n2015 - 2018\nDeveloper, Initech\n2018 - 2020\nLead, Hooli\n2020 - 2022\n"
+    experience = extract_experience(text, nlp(text))
+    companies = [exp.company for exp in experience]
+    assert "Hooli" not in companies[:-1]
+
+
+def test_skills_sections_match_baseline_findall():
+    for text in SKILLS_SECTION_TEXTS:
+        spans = skills_section_spans(text, split_sections(text))
+        assert [text[start:end].lower() for start, end in spans] == baseline_skills_sections(text)
+
+
+def test_header_line_ending_skills_section_is_not_read_as_skills():
+    assert sorted(extract_skills(SKILLS_SECTION_TEXTS[-2])) == ["python", "sql"]